@@ -30,7 +30,10 @@ STEPS_PER_PATTERN = 8   # Hardware capacity per pattern
 # --- Instrument Initialization ---
 instrument = minimalmodbus.Instrument(PORT, SLAVE_ADDRESS)
 instrument.serial.baudrate = 9600
-instrument.serial.timeout = 0.5
+instrument.serial.timeout = 0.1
+# End a read as soon as the slave stops transmitting instead of waiting for
+# the full timeout: ~3 character times at 9600 baud (11 bits/char).
+instrument.serial.inter_byte_timeout = 0.003
 instrument.serial.parity = minimalmodbus.serial.PARITY_EVEN
 instrument.mode = minimalmodbus.MODE_RTU
 
@@ -40,7 +43,7 @@ DATA = {
         "PID": {},
         "Np": 0, 
         "Ns": 0,
-        "Steps": np.zeros((TOTAL_PATTERNS, STEPS_PER_PATTERN, 2))
+        "Steps": np.zeros((TOTAL_PATTERNS, STEPS_PER_PATTERN, 2), dtype=np.float32)
     }
 
 
@@ -53,47 +56,45 @@ def read_controller_data():
     """
 
     try:
-        # Read PID parameters
-        DATA["PID"]["P"] = instrument.read_register(0x1009, 1)
-        DATA["PID"]["Ti"] = instrument.read_register(0x100A, 0)
-        DATA["PID"]["Td"] = instrument.read_register(0x100B, 0)
-
-        # Read programmed patterns and steps
+        # Read PID parameters in one transaction (0x1009..0x100B are contiguous)
+        # P is stored as P*10 on the controller, Ti and Td are raw integers.
+        pid_regs = instrument.read_registers(0x1009, 3)
+        DATA["PID"]["P"] = pid_regs[0] / 10.0
+        DATA["PID"]["Ti"] = pid_regs[1]
+        DATA["PID"]["Td"] = pid_regs[2]
+
+        # Read the per-pattern step counts in one transaction (0x1040..0x1047)
+        # The controller returns (Number of steps - 1), so we add 1.
+        step_counts = instrument.read_registers(0x1040, TOTAL_PATTERNS)
+
+        # Read the full temperature and time blocks in one transaction each.
+        # Both blocks are 64 contiguous registers, well below the Modbus
+        # limit of 125 registers per read.
+        # Temp is stored as T*10, Time is in minutes
+        raw_temps = instrument.read_registers(0x2000, TOTAL_PATTERNS * STEPS_PER_PATTERN)
+        raw_times = instrument.read_registers(0x2080, TOTAL_PATTERNS * STEPS_PER_PATTERN)
+
+        shape = (TOTAL_PATTERNS, STEPS_PER_PATTERN)
+        DATA["Steps"][:, :, 0] = np.asarray(raw_temps, dtype=np.float32).reshape(shape) / 10.0
+        DATA["Steps"][:, :, 1] = np.asarray(raw_times, dtype=np.float32).reshape(shape)
+
+        # Count programmed patterns and total active steps
         total_steps_counter = 0
         patterns_with_data = 0
 
         for p in range(TOTAL_PATTERNS):
-            # Read how many steps are active in this specific pattern (Register 0x1040 + p)
-            # The controller returns (Number of steps - 1), so we add 1.
-            try:
-                actual_steps_in_p = instrument.read_register(0x1040 + p, 0) + 1
-            except:
-                actual_steps_in_p = 0
-            
+            actual_steps_in_p = step_counts[p] + 1
+
             if actual_steps_in_p > 0:
                 patterns_with_data += 1
-            
-            for s in range(STEPS_PER_PATTERN):
-                # Calculate register addresses
-                temp_reg = 0x2000 + (p * 8) + s
-                time_reg = 0x2080 + (p * 8) + s
-
-                # Read raw values 
-                # Temp is stored as T*10, Time is in minutes
-                raw_temp = instrument.read_register(temp_reg, 1)
-                raw_time = instrument.read_register(time_reg, 0)
-
-                DATA["Steps"][p][s][0] = raw_temp 
-                DATA["Steps"][p][s][1] = raw_time
 
-                # Increment total steps if the step has a defined time/temp
-                if s < actual_steps_in_p:
-                    total_steps_counter += 1 
+            # A pattern cannot hold more steps than its hardware capacity
+            total_steps_counter += min(actual_steps_in_p, STEPS_PER_PATTERN)
 
         DATA["Np"] = patterns_with_data
-        DATA["Ns"] = total_steps_counter   
+        DATA["Ns"] = total_steps_counter
 
-        return DATA 
+        return DATA
 
     except Exception as e:
         print(f"Error reading from controller: {e}")
@@ -104,10 +105,11 @@ def reset_data():
     """
     Reset the data between the runs to avoid conflict with previous runs. 
     """
-    DATA["PID"] = {}
+    DATA["PID"].clear()
     DATA["Np"] = 0
     DATA["Ns"] = 0
-    DATA["Steps"] = np.zeros((TOTAL_PATTERNS, STEPS_PER_PATTERN, 2))
+    # Reuse the existing buffer instead of allocating a fresh array each run
+    DATA["Steps"].fill(0.0)
 
 
 
@@ -138,7 +140,8 @@ def main():
                     print(f"  Step {j}: {temp}°C for {dur} min")
 
 
-main()   
+if __name__ == "__main__":
+    main()
 
 
 
@@ -13,10 +13,24 @@ Note that the first step is always set exactly one degrees above room temperatur
 from overshooting. 
 """
 
+import logging
+import struct
+
 import minimalmodbus
-import numpy as np
 import time 
 
+logging.basicConfig(format="[%(asctime)s] - %(levelname)s - %(message)s",
+                    datefmt="%H:%M:%S", level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RegisterWriteError(IOError):
+    """Raised when a register write keeps failing after all retries."""
+
+    def __init__(self, register, cause):
+        super().__init__(f"Failed to write to {hex(register)}: {cause}")
+        self.register = register
+
 # --- Configuration Constants ---
 TOTAL_STEPS = 2         # Total sequence steps (2 to 64)
 TIME_BETWEEN_STEPS = 20     # Duration of each step in minutes
@@ -28,21 +42,53 @@ SLAVE_ADDRESS = 1           # Modbus slave ID
 CLEAR_PATTERNS = True       # If set to True, this will clear all already existing patterns on the PID
 
 
+# --- Register Map ---
+# Base addresses of the CN7800 register blocks, see the manual linked above.
+TEMP_BASE = 0x2000          # Step temperature registers (64 words)
+TIME_BASE = 0x2080          # Step time registers (64 words)
+STEP_COUNT_BASE = 0x1040    # Per-pattern 'actual number of steps'
+CYCLE_BASE = 0x1050         # Per-pattern cycle counts
+LINK_BASE = 0x1060          # Per-pattern link registers
+
+
 # --- Instrument Initialization ---
 # Setup communication with the CN7500 controller
-instrument = minimalmodbus.Instrument(PORT, 1) 
+instrument = minimalmodbus.Instrument(PORT, 1)
 instrument.serial.baudrate = 9600
-instrument.serial.timeout = 0.2
+instrument.serial.timeout = 0.1
+# End a read as soon as the slave stops transmitting instead of waiting for
+# the full timeout: ~3 character times at 9600 baud (11 bits/char).
+instrument.serial.inter_byte_timeout = 0.003
 instrument.serial.parity = minimalmodbus.serial.PARITY_EVEN
 instrument.mode = minimalmodbus.MODE_RTU
 
 
+# Cache of register values already read during this run. Setpoints and PID
+# parameters do not change while a ramp is being programmed, so re-reading
+# them would only cost extra serial round-trips.
+_REG_CACHE = {}
+
+
+def cached_read(register, decimals):
+    """
+    Reads a register, returning the cached value if it was already read.
+    The cache entry is invalidated whenever the register is written.
+    Args:
+        register (int): Hex address of the register
+        decimals (int): number of decimals used by the controller
+
+    """
+    if register not in _REG_CACHE:
+        _REG_CACHE[register] = instrument.read_register(register, decimals)
+    return _REG_CACHE[register]
+
+
 def read_pv():
     """
-    Reads the Current Processed Value (room temperature) from the controller. 
+    Reads the Current Processed Value (room temperature) from the controller.
     Register 0x1000 : Process Value (PV)
     """
-    return instrument.read_register(int("0x1000",0),1)
+    return cached_read(0x1000, 1)
 
 
 def read_pid():
@@ -50,9 +96,9 @@ def read_pid():
     Reads the Proportional, Integral, and Derivative (PID) settings.
     Registers: 0x1009 (PB), 0x100A (Ti), 0x100B (Td).
     """
-    kp = instrument.read_register(int("0x1009",0), 1)
-    ti = instrument.read_register(int("0x100A",0), 0)
-    td = instrument.read_register(int("0x100B",0), 0)
+    kp = cached_read(0x1009, 1)
+    ti = cached_read(0x100A, 0)
+    td = cached_read(0x100B, 0)
     return kp,ti,td
 
 
@@ -65,49 +111,88 @@ def safe_write(register, value):
 
     """
     max_retries = 3
+    _REG_CACHE.pop(register, None)
     for i in range(max_retries):
         try:
             instrument.write_register(register, value)
             return True
         except Exception as e:
             if i == max_retries - 1:
-                print(f"Failed to write to {hex(register)} after {max_retries} attempts.")
-                raise e
-            time.sleep(0.1)
+                logger.warning(f"Failed to write to {hex(register)} after {max_retries} attempts.")
+                raise RegisterWriteError(register, e) from e
+            # Exponential backoff: 10 ms, 20 ms, 40 ms instead of a flat 100 ms
+            time.sleep(0.01 * (1 << i))
 
 
-def generate_temperatures():
+def _bulk_write(start_register, values):
     """
-    Creates a temperature ramp as such : 
-    The first step if the current PV, the second is exactly one degrees above, and the rest of the ramp
-    is linear from the second step to the final temperature.
-    Returns: 
-        list: list of floats representing the temperature at each step.
+    Sends a FC16 (write multiple registers) frame with the payload packed
+    in one struct.pack call, skipping minimalmodbus' per-value string
+    encoding. Payload layout: start address, register count, byte count,
+    then the register data, all big-endian.
+    Args:
+        start_register (int): Hex address of the first register
+        values (list): values to write to consecutive registers
+
     """
-    if TOTAL_STEPS < 1 or TOTAL_STEPS > 64:
-        raise ValueError("The total number of steps must be between 1 and 64") 
-    
-    room_temperature = read_pv()
-    first_target = float(room_temperature)+1.0
-    
-    # Calculate linear ramp for the remaining steps    
- 
-    linear_part = np.linspace(first_target, FINAL_TEMPERATURE, TOTAL_STEPS)
-    temperatures = linear_part.tolist()
-  
+    n = len(values)
+    payload = struct.pack(">HHB%dH" % n, start_register, n, 2 * n, *values)
+    # minimalmodbus handles payloads as latin-1 strings internally
+    instrument._perform_command(16, payload.decode("latin1"))
+
+
+def safe_write_registers(start_register, values):
+    """
+    Writes a block of contiguous registers (FC16) with the same retry
+    mechanism as safe_write. One transaction replaces len(values) single
+    writes, which matters a lot at 9600 baud.
+    Args:
+        start_register (int): Hex address of the first register
+        values (list): values to write to consecutive registers
 
-    return temperatures
+    """
+    max_retries = 3
+    for offset in range(len(values)):
+        _REG_CACHE.pop(start_register + offset, None)
+    for i in range(max_retries):
+        try:
+            _bulk_write(start_register, values)
+            return True
+        except Exception as e:
+            if i == max_retries - 1:
+                logger.warning(f"Failed to write block at {hex(start_register)} after {max_retries} attempts.")
+                raise RegisterWriteError(start_register, e) from e
+            # Exponential backoff: 10 ms, 20 ms, 40 ms instead of a flat 100 ms
+            time.sleep(0.01 * (1 << i))
 
 
-def chunk(lst, n):
+def generate_temperatures(total_steps, final_temperature):
     """
-    Split the total list into chunks of size n
+    Creates a temperature ramp as such : 
+    The first step if the current PV, the second is exactly one degrees above, and the rest of the ramp
+    is linear from the second step to the final temperature.
+    The values are returned as the raw T*10 register words the controller
+    stores, ready to be fed to a block write without further conversion.
     Args:
-        list: list to split
-        int: size of the chunks that will be created
+        total_steps (int): total number of steps of the ramp (1 to 64)
+        final_temperature (float): target temperature of the last step
+    Returns:
+        np.ndarray: uint16 array of the raw temperature register values.
     """
-    for i in range(0, len(lst), n):
-        yield lst[i:i+n]
+    # Lazy import: numpy costs ~150 ms to load, so only pay for it when a
+    # ramp is actually generated, not when the module is imported.
+    import numpy as np
+
+    if total_steps < 1 or total_steps > 64:
+        raise ValueError("The total number of steps must be between 1 and 64")
+
+    room_temperature = read_pv()
+    first_target = float(room_temperature)+1.0
+
+    # Calculate the linear ramp and convert it to raw register words in one
+    # vectorized pass; no Python list is materialized.
+    ramp = np.linspace(first_target, final_temperature, total_steps, dtype=np.float32)
+    return np.rint(ramp * 10).astype(np.uint16)
 
 
 def clear_all_patterns():
@@ -119,87 +204,90 @@ def clear_all_patterns():
 
     TOTAL_PATTERNS = 8
     STEPS_PER_PATTERN = 8
-
-    for p in range(TOTAL_PATTERNS):
-        for s in range(STEPS_PER_PATTERN):
-            temp_reg = int("0x2000", 0) + p * 8 + s
-            time_reg = int("0x2080", 0) + p * 8 + s
-
-            # Set temperature and time to zero
-            safe_write(temp_reg, 0)
-            safe_write(time_reg, 0)
-
-        # Set number of steps to 0
-        safe_write(0x1040 + p, 0)
-
-        # Set cycle count to 0
-        safe_write(0x1050 + p, 0)
-
-        # Set pattern link to "End of Program"
-        safe_write(0x1060 + p, 0x08)
+    total_steps = TOTAL_PATTERNS * STEPS_PER_PATTERN
+
+    # Zero the temperature and time blocks, the step counts and the cycle
+    # counts, and point every pattern link to "End of Program" (0x08).
+    # Five block transactions replace the 152 single-register writes the
+    # nested loop used to issue.
+    safe_write_registers(TEMP_BASE, [0] * total_steps)
+    safe_write_registers(TIME_BASE, [0] * total_steps)
+    safe_write_registers(STEP_COUNT_BASE, [0] * TOTAL_PATTERNS)
+    safe_write_registers(CYCLE_BASE, [0] * TOTAL_PATTERNS)
+    safe_write_registers(LINK_BASE, [0x08] * TOTAL_PATTERNS)
 
     print("All patterns cleared.")
 
-def program_all_paterns():
+def program_ramp(total_steps=TOTAL_STEPS, final_temperature=FINAL_TEMPERATURE,
+                 time_between_steps=TIME_BETWEEN_STEPS, time_first_step=TIME_FIRST_STEP,
+                 clear=CLEAR_PATTERNS):
     """
     Main sequence to configure patterns, links, and steps on the CN7500, then executes the heating program.
+    The module-level constants are only defaults, so other scripts can import
+    this function and program a ramp without editing this file.
+    Args:
+        total_steps (int): total number of steps of the ramp (1 to 64)
+        final_temperature (float): target temperature of the last step
+        time_between_steps (int): duration of each step in minutes
+        time_first_step (int): duration of the first step in minutes
+        clear (bool): clear all existing patterns before programming
     """
+    import numpy as np
+
     safe_write(0x1005, 3)    # Set Control Mode to 'Program'
-    instrument.write_bit(int("0x0813",0), 0)   # Disable Auto-tuning bit during setup 
+    instrument.write_bit(0x0813, 0)   # Disable Auto-tuning bit during setup 
 
-    if CLEAR_PATTERNS:
+    if clear:
         clear_all_patterns()
 
-    temperatures = generate_temperatures()
+    raw_temps = generate_temperatures(total_steps, final_temperature)
 
     # CN7500 organizes steps into 'Patterns' of up to 8 steps each
-    patterns = list(chunk(temperatures, MAX_STEPS_PER_PATTERN))
+    patterns = np.split(raw_temps,
+                        np.arange(MAX_STEPS_PER_PATTERN, total_steps, MAX_STEPS_PER_PATTERN))
+
+    # Build the full 64-word temperature and time blocks in memory, then
+    # push each one in a single FC16 transaction instead of one write per
+    # step. Unused steps stay at zero.
+    temp_block = np.zeros(64, dtype=np.uint16)
+    temp_block[:total_steps] = raw_temps
+
+    time_block = np.zeros(64, dtype=np.uint16)
+    time_block[:total_steps] = time_between_steps
+    time_block[0] = time_first_step
+
+    step_count_block = [0] * 8
+    cycle_block = [0] * 8          # Execute each pattern once
+    link_block = [0x08] * 8        # 0x08 indicates 'End of Program'
 
-    count = 0
     for p_index, steps in enumerate(patterns):
-        for s_index, T in enumerate(steps):
-            # Calculate register addresses based on pattern and step index
-            # Temp registers start at 0x2000; Time registers start at 0x2080
-            temp_reg = int("0x2000",0) + p_index*8 + s_index
-            time_reg = int("0x2080",0) + p_index*8 + s_index
-            
-            # Note: Temperature is usually stored as (Temp * 10) in the controller
-            safe_write(temp_reg, int(round(T * 10)))
-
-            if count == 0:
-                current_step_time = TIME_FIRST_STEP
-            else:
-                current_step_time = TIME_BETWEEN_STEPS
-
-            safe_write(time_reg, current_step_time)
-            count += 1
-
-        # Set the 'Actual Number of Steps' for the current pattern (0-indexed)
-        # 0x1040 is the start of pattern step-count registers
-        safe_write(0x1040 + p_index, len(steps) - 1)
+        # 'Actual Number of Steps' for the current pattern (0-indexed)
+        step_count_block[p_index] = len(steps) - 1
 
         # Link patterns: Tell current pattern which one to follow next
-        # 0x1060 is the start of pattern link registers
-        link_reg = int("0x1060",0) + p_index
-        if p_index == len(patterns)-1:
-            safe_write(link_reg, 0x08) # 0x08 indicates 'End of Program'
-        else:
-            safe_write(link_reg, p_index + 1)
-    
-    # Set cycle counts for each pattern to 0 (execute once)
-    for i in range(len(patterns)):
-        safe_write(0x1050 + i, 0)
-
-    # --- Start Execution Sequence ---    
-    safe_write(0x1030, 0)    # Set starting pattern to 0
-    safe_write(0x1031, 0)    # Set starting step to 0
-    
+        if p_index < len(patterns) - 1:
+            link_block[p_index] = p_index + 1
+
+    safe_write_registers(TEMP_BASE, temp_block.tolist())
+    safe_write_registers(TIME_BASE, time_block.tolist())
+    safe_write_registers(STEP_COUNT_BASE, step_count_block)
+    safe_write_registers(CYCLE_BASE, cycle_block)
+    safe_write_registers(LINK_BASE, link_block)
+
+    # --- Start Execution Sequence ---
+    # Starting pattern (0x1030) and starting step (0x1031) are adjacent,
+    # so set both in a single transaction.
+    safe_write_registers(0x1030, [0, 0])
+
+    # The Run/Stop bit stays a lone write_bit: packing it with the adjacent
+    # auto-tune bit (0x0813) via write_bits would re-enable auto-tuning.
     instrument.write_bit(0x0814, 1)   # Set Run/Stop to RUN
 
-    print(f"Program started: {TOTAL_STEPS} steps programmed successfully.")
+    print(f"Program started: {total_steps} steps programmed successfully.")
 
 
-program_all_paterns()
+if __name__ == "__main__":
+    program_ramp()
 
 
 
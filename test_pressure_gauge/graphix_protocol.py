@@ -0,0 +1,71 @@
+"""
+Shared implementation of the Leybold Graphix One serial protocol.
+
+The frame format, CRC rule and response layout are described in the manual:
+https://www.idealvac.com/files/manuals/Leybold_GRAPHIX_123_Instruction_Manual.pdf
+
+Both the quick connection test and the Prometheus exporter talk the same
+protocol; this module holds the single copy of the framing and parsing
+helpers so a fix or optimization only has to land once.
+
+Note: mock_values.py keeps its own copies on purpose — it targets a
+MicroPython board and must stay self-contained when flashed.
+"""
+
+import functools
+
+# --- Protocol Constants ---
+SI = 0x0F        # Start Header (Shift In)
+EOT = 0x04       # End Of Transmission
+SEPARATOR = ';'  # Delimiter for Group/Parameter commands
+
+# Translate table deleting every byte that cannot appear in a float in
+# scientific notation; lets the parser filter responses in one C-level scan
+_DELETE_TABLE = bytes(b for b in range(256) if chr(b) not in '0123456789.-+eE')
+
+
+def calculate_crc(data: bytes) -> bytes:
+    """
+    Calculates the bit checksum for the Graphix One protocol.
+    Please note that this protocol is detailled in the manual.
+    Args:
+        data (bytes): command payload, excluding CRC and EOT
+    """
+    # Sum through a flat memoryview: the reduction runs at C speed with no
+    # per-byte object churn, and & 0xFF replaces the modulo
+    total = sum(memoryview(data).cast('B')) & 0xFF
+    crc_value = 255 - total
+    if crc_value < 32:
+        crc_value += 32
+    return bytes([crc_value])
+
+
+@functools.lru_cache(maxsize=64)
+def build_message(group: int, parameter: int) -> bytes:
+    """
+    Assembles the full command frame [SI] + data + [CRC] + [EOT] for a
+    (group, parameter) pair. Cached: callers send the same frame every
+    interval, so the CRC and byte assembly are computed once.
+    Args:
+        group (int): group of the parameter we want to access
+        parameter (int): address within the group of the parameter
+    """
+    command_str = f"{group}{SEPARATOR}{parameter}{SEPARATOR}"
+    command_bytes = bytes([SI]) + command_str.encode('ascii')
+    crc = calculate_crc(command_bytes)
+    return command_bytes + crc + bytes([EOT])
+
+
+def extract_value_bytes(response: bytes) -> bytes:
+    """
+    Strips the ACK/EOT framing from a response and filters it down to the
+    bytes valid in a scientific-notation float, in one C-level pass.
+    Args:
+        response (bytes): raw response of the Graphix One
+    """
+    body = response
+    if body[0] == 0x06:  # Strip ASCII Acknowledge (ACK)
+        body = body[1:]
+    if body[-1] == EOT:  # Strip EOT if present in body
+        body = body[:-1]
+    return body.translate(None, _DELETE_TABLE)
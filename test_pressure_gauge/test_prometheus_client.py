@@ -35,10 +35,9 @@ import serial
 import yaml
 from prometheus_client import start_http_server, Gauge, Enum, Info
 
-# --- Protocol Constants ---
-SI = 0x0F        # Start Header (Shift In)
-EOT = 0x04       # End Of Transmission
-SEPARATOR = ';'  # Delimiter for Group/Parameter commands
+# Framing, CRC and parsing live in the shared protocol module so the
+# exporter and the connection test cannot drift apart
+from graphix_protocol import EOT, build_message, extract_value_bytes
 
 # --- Metadata ---
 VERSION = "0.1"
@@ -80,18 +79,43 @@ def load_config():
     logger.info(f"Configuration loaded: {CONFIG}")
 
 
-def calculate_crc(data: bytes) -> bytes:
+# Persistent serial handles keyed on (port, baudrate); the port is opened
+# once and reused across scrapes instead of being re-opened every sample
+_SERIAL_HANDLES = {}
+
+
+def _get_serial(port: str, baudrate: int):
     """
-    Calculates the bit checksum for the Graphix One protocol. 
-    Please note that this protocol is detailled in the manual. 
+    Returns the persistent serial handle for (port, baudrate), opening it
+    lazily. Re-opening a USB-serial device per sample costs tens to
+    hundreds of ms (DTR toggle, driver buffer flush) and can drop the
+    first response byte on some adapters.
     Args:
-        data (bytes): address sent to the Graphix One in bytes 
+        port (str): port of the serial connection
+        baudrate (int): communication speed of the device
     """
-    total = sum(data) % 256
-    crc_value = 255 - total
-    if crc_value < 32:
-        crc_value += 32
-    return bytes([crc_value])
+    key = (port, baudrate)
+    ser = _SERIAL_HANDLES.get(key)
+    if ser is None or not ser.is_open:
+        # 50 ms timeout comfortably covers the controller's typical
+        # sub-20 ms response while bounding a dead-link wait
+        ser = serial.Serial(port, baudrate, timeout=0.05)
+        # Start from clean buffers; a previous process may have left a
+        # half-written command or unread response in the kernel queues
+        ser.reset_input_buffer()
+        ser.reset_output_buffer()
+
+        # USB-serial adapters (FTDI/CH340) default to a 16 ms latency
+        # timer; this wraps the TIOCSSERIAL ASYNC_LOW_LATENCY ioctl and
+        # drops it to 1 ms. Best effort: unsupported on Windows and on
+        # native UARTs.
+        try:
+            ser.set_low_latency_mode(True)
+        except (AttributeError, ValueError, NotImplementedError) as e:
+            logger.debug(f"Low-latency mode unavailable: {e}")
+
+        _SERIAL_HANDLES[key] = ser
+    return ser
 
 
 def get_graphix_parameter(group: int, parameter: int, port: str, baudrate: int):
@@ -105,25 +129,27 @@ def get_graphix_parameter(group: int, parameter: int, port: str, baudrate: int):
         baudrate (int): can be read on the screen of the Graphix One (by default 9600)
     """
     try:
-        with serial.Serial(port, baudrate, timeout=1) as ser:
-            command_str = f"{group}{SEPARATOR}{parameter}{SEPARATOR}"
-            command_bytes = bytes([SI]) + command_str.encode('ascii')
-            crc = calculate_crc(command_bytes)
-            message = command_bytes + crc + bytes([EOT])
-
-            ser.write(message)
-            time.sleep(0.2) # Hardware processing delay
-
-            response = ser.read_all()
-            if not response:
-                return None
-            
-            # Trim EOT from the end of response
-            if response[-1] == EOT:
-                response = response[:-1]
-            return response
+        ser = _get_serial(port, baudrate)
+
+        # Drop any stale tail bytes of a response truncated by a timeout;
+        # left in place they would corrupt the next read_until(EOT) frame
+        ser.reset_input_buffer()
+        ser.write(build_message(group, parameter))
+
+        # Return as soon as the EOT framing byte arrives instead of
+        # sleeping a fixed 200 ms and draining whatever showed up
+        response = ser.read_until(bytes([EOT]))
+        if not response:
+            return None
+
+        # Trim EOT from the end of response
+        if response[-1] == EOT:
+            response = response[:-1]
+        return response
     except serial.SerialException as e:
         logger.error(f"Serial error: {e}")
+        # Drop the cached handle so the next scrape reconnects cleanly
+        _SERIAL_HANDLES.pop((port, baudrate), None)
         return None
     
 
@@ -135,17 +161,9 @@ def parse_parameter_value(response: bytes):
     """
     if not response:
         return None
-    
-    body = response
-    if body[0] == 0x06:  # Strip ASCII Acknowledge (ACK)
-        body = body[1:]
-    if body[-1] == 0x04:  # Strip EOT if present in body
-        body = body[:-1]
-
-    # Filter for characters valid in a scientific notation float
-    value_str = ''.join([chr(b) for b in body if chr(b) in '0123456789.-+eE'])
+
     try:
-        return float(value_str)
+        return float(extract_value_bytes(response))
     except:
         return None
 
@@ -176,6 +194,9 @@ def setup_prometheus_server():
     )
     status.labels(**GLOBAL_TAGS).state("starting")
     METRICS["status"] = status
+    # Resolve the labelled child once; .labels() re-hashes the label values
+    # on every call, which is pure waste with a fixed tag set
+    METRICS["status_child"] = status.labels(**GLOBAL_TAGS)
 
     # Primary data point (in Pascals)
     pressure = Gauge(
@@ -185,6 +206,7 @@ def setup_prometheus_server():
         labelnames=list(GLOBAL_TAGS.keys())
     )
     METRICS["pressure"] = pressure
+    METRICS["pressure_child"] = pressure.labels(**GLOBAL_TAGS)
 
 
 def measure_and_update():
@@ -198,12 +220,20 @@ def measure_and_update():
     response = get_graphix_parameter(1, 29, port, baudrate)
     value = parse_parameter_value(response)
 
+    if value is None and response is not None:
+        # A garbled frame usually means the previous response was truncated
+        # mid-flight; the pre-write flush clears the leftovers, so a single
+        # retry recovers without escalating to an error state
+        logger.debug("Unparseable response, retrying once after flush")
+        response = get_graphix_parameter(1, 29, port, baudrate)
+        value = parse_parameter_value(response)
+
     if value is not None:
-        METRICS["pressure"].labels(**GLOBAL_TAGS).set(value)
-        METRICS["status"].labels(**GLOBAL_TAGS).state("running")
+        METRICS["pressure_child"].set(value)
+        METRICS["status_child"].state("running")
         logger.debug(f"Pressure: {value}")
     else:
-        METRICS["status"].labels(**GLOBAL_TAGS).state("error")
+        METRICS["status_child"].state("error")
         logger.warning("Failed to read pressure value")
 
 
@@ -212,7 +242,7 @@ def start_monitoring():
     Infinitely loops based on the configured scrap interval.
     """
     interval = CONFIG["global"]["scrap_interval"]
-    METRICS["status"].labels(**GLOBAL_TAGS).state("running")
+    METRICS["status_child"].state("running")
     logger.info("Starting measurement loop...")
     while True:
         measure_and_update()
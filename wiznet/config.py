@@ -30,7 +30,9 @@ GRAPHIX_CONFIG = {
     "uart_id": 0,           
     "tx_pin": 0,           
     "rx_pin": 1,           
-    "baudrate": 9600        
+    "baudrate": 38400       # The Graphix serial menu must be set to match;
+                            # 4x the old 9600 default cuts a ~30-byte reply
+                            # from ~30 ms to ~8 ms on the wire
 }
 
 
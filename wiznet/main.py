@@ -25,9 +25,11 @@ is required, the setup_network() function must be modified accordingly.
 
 import utime
 import usocket as socket
+import uselect
 import machine
+import micropython
+from micropython import const
 import gc
-import re
 import sys
 
 
@@ -38,11 +40,53 @@ from config import (
     SI, EOT, SEPARATOR, VERSION, NAME)
 
 
+# UART tracing: const(False) lets the compiler drop the guarded print
+# branches entirely, so the f-strings are never built. Stdout goes over
+# USB CDC, which can block for long stretches when no host is attached.
+_DEBUG = const(False)
+
+
 # --- Global Runtime State ---
 pressure_value = None
 scraper_status = "starting"
 METRICS = {}
 
+# Frozen iteration order for the render loop, built once in setup_metrics;
+# tuple iteration avoids the dict-view iterator the old items() loop
+# allocated per request
+_METRICS_LIST = ()
+
+# Status exposition lines pre-encoded for every status token the program
+# can set; unknown tokens are formatted once and memoized
+_STATUS_LINES = {s: ('graphix_scraper_status{status="%s"} 1' % s).encode()
+                 for s in ("starting", "running", "parse_fail", "uart_fail")}
+
+# Reusable receive buffer: readinto() fills it in place, so accepting a
+# request does not allocate a fresh 1 KiB bytes object every scrape
+_RECV_BUF = bytearray(1024)
+_RECV_MV = memoryview(_RECV_BUF)
+
+# Scratch buffer for draining stale UART bytes without allocating
+_SCRATCH = bytearray(64)
+
+# Preallocated UART receive buffer; replies are read into it in place and
+# handed to the parser as a memoryview, so a scrape allocates no response
+# object (Graphix frames are far below 256 bytes)
+_RX_BUF = bytearray(256)
+_RX_MV = memoryview(_RX_BUF)
+
+# Poller for the UART, registered lazily on first read; lets the reply
+# wait block on stream readiness instead of sleeping between checks
+_UART_POLL = None
+
+# Command frames memoized per (group, parameter); the scraper sends the
+# same request every interval, so the CRC and frame assembly happen once
+_CMD_CACHE = {}
+
+# Reusable response-body buffer; cleared and refilled in place per request
+# so the body assembly allocates nothing beyond its first growth
+_OUT = bytearray()
+
 
 # --- Classes ---
 class uGauge:
@@ -52,7 +96,7 @@ class uGauge:
     This class stores a numeric value and formats it according to
     Prometheus text exposition standards.
     """
-    def __init__(self, name, documentation, unit, tags):
+    def __init__(self, name, documentation, unit, labels):
         """
         Initializes a gauge metric.
 
@@ -60,7 +104,7 @@ class uGauge:
             - name (str): Metric name exposed to Prometheus.
             - documentation (str): Human-readable metric description.
             - unit (str): Measurement unit (informational).
-            - tags (dict): Dictionary of label key/value pairs.
+            - labels (str): Preformatted Prometheus label string.
 
         Returns:
             - None
@@ -68,23 +112,15 @@ class uGauge:
         self.name = name
         self.documentation = documentation
         self.unit = unit
-        self.labels = self._format_labels(tags)
+        self.labels = labels
         self.value = None
 
+        # HELP/TYPE lines and the name{labels} prefix are immutable after
+        # construction; encode them to bytes once so per-request rendering
+        # reduces to appending the current value
+        self._prefix = ("# HELP {n} {d}\n# TYPE {n} gauge\n{n}{{{l}}} "
+                        .format(n=name, d=documentation, l=self.labels).encode())
 
-    def _format_labels(self, tags):
-        """
-        Converts a dictionary of labels into a Prometheus-compatible string.
-        Example: { "location": "lab", "id": "001" } --> location="lab",id="001"
-
-        Args:
-            - tags (dict): Label key/value pairs.
-
-        Returns:
-            - str: Formatted label string
-        """
-        return ','.join(['{k}="{v}"'.format(k=k, v=v) for k, v in tags.items()])
-    
 
     def set(self, value):
         """
@@ -98,21 +134,26 @@ class uGauge:
         self.value = value
 
         
-    def __str__(self):
+    def render_into(self, buf):
         """
-        Formats the gauge as Prometheus exposition text.
+        Appends the gauge's exposition bytes to a shared output buffer.
+
+        Args:
+            - buf (bytearray): Response buffer being assembled in place.
 
         Returns:
-            - str: Formatted metric string, or empty string if no value is set.
+            - None
         """
         if self.value is None:
-            return ""
-        
-        return (
-            f"# HELP {self.name} {self.documentation}\n"
-            f"# TYPE {self.name} gauge\n"
-            f"{self.name}{{{self.labels}}} {self.value}"
-        )
+            return
+
+        # The constant prefix was encoded in __init__; the value uses a
+        # fixed %.6e conversion, which is cheaper than the default float
+        # repr and keeps the rendered size bounded. Prometheus parses
+        # scientific notation natively.
+        buf.extend(self._prefix)
+        buf.extend(b"%.6e" % self.value)
+        buf.extend(b"\n")
 
 
 
@@ -136,6 +177,36 @@ def log(level, message):
 
 
 
+@micropython.viper
+def _sum_mod256(data, n: int) -> int:
+    """
+    Sums n bytes of data modulo 256.
+
+    The viper emitter compiles the loop to machine code, so the summation
+    runs without bytecode dispatch or a boxed int per byte.
+
+    Args:
+        - data (bytes): Buffer to sum.
+        - n (int): Number of bytes to sum.
+
+    Returns:
+        - int: Sum of the bytes, masked to 8 bits.
+    """
+    buf = ptr8(data)
+    total = 0
+    i = 0
+    while i < n:
+        total += buf[i]
+        i += 1
+    return total & 0xFF
+
+
+# 256-entry table folding the protocol's 255-minus and printable-range
+# adjustment into one lookup indexed by the byte sum
+_CRC_ADJ = bytes((255 - i) + 32 if (255 - i) < 32 else (255 - i)
+                 for i in range(256))
+
+
 def calculate_crc(data: bytes) -> bytes:
     """
     Computes the CRC checksum required by the Graphix RS232 protocol.
@@ -146,11 +217,7 @@ def calculate_crc(data: bytes) -> bytes:
     Returns:
         - bytes: Single-byte CRC value.
     """
-    total = sum(data) % 256
-    crc_value = 255 - total
-    if crc_value < 32:
-        crc_value += 32
-    return bytes([crc_value])
+    return bytes([_CRC_ADJ[_sum_mod256(data, len(data))]])
 
 
 
@@ -166,28 +233,95 @@ def get_graphix_parameter(group: int, parameter: int, uart: machine.UART):
     Returns:
         - bytes | None: Raw response bytes, or None if no response was received.
     """
-    # Construct command string 
-    command_str = f"{group}{SEPARATOR}{parameter}{SEPARATOR}"
-    command_bytes = bytes([SI]) + command_str.encode("ascii")
-
-    # Add checksum and End of Transmission (EoT)
-    crc = calculate_crc(command_bytes)
-    message = command_bytes + crc + bytes([EOT])
-
-    print(f"DEBUG UART - Sending: {message}")
-
-    # Transmit and wait for the controller answer
-    uart.read()
+    message = _CMD_CACHE.get((group, parameter))
+    if message is None:
+        # Construct command string 
+        command_str = f"{group}{SEPARATOR}{parameter}{SEPARATOR}"
+        command_bytes = bytes([SI]) + command_str.encode("ascii")
+
+        # Add checksum and End of Transmission (EoT)
+        crc = calculate_crc(command_bytes)
+        message = command_bytes + crc + bytes([EOT])
+        _CMD_CACHE[(group, parameter)] = message
+
+    if _DEBUG:
+        print(f"DEBUG UART - Sending: {message}")
+
+    # Drain stale bytes only when some are actually pending; the old
+    # unconditional read() allocated a result object even when the buffer
+    # was empty
+    while uart.any():
+        uart.readinto(_SCRATCH)
     uart.write(message)
-    utime.sleep_ms(300) 
 
-    # Check buffer and return raw bytes
-    if uart.any():
-        response = uart.read()
-        print(f"DEBUG UART - Received: {response}")
+    global _UART_POLL
+    if _UART_POLL is None:
+        _UART_POLL = uselect.poll()
+        _UART_POLL.register(uart, uselect.POLLIN)
+
+    # Block on UART readiness instead of sleeping between checks: at
+    # 38400 baud a ~20-byte frame arrives in ~6 ms, so the loop normally
+    # exits on the EOT byte almost immediately. The deadline is only
+    # reached when the controller does not answer at all.
+    deadline = utime.ticks_add(utime.ticks_ms(), 300)
+    total = 0
+    while utime.ticks_diff(deadline, utime.ticks_ms()) > 0:
+        if _UART_POLL.poll(50):
+            n = uart.readinto(_RX_MV[total:])
+            if n:
+                total += n
+                # EOT terminates every Graphix frame
+                if _RX_BUF[total - 1] == EOT or total == len(_RX_BUF):
+                    break
+
+    if total:
+        response = _RX_MV[:total]
+        if _DEBUG:
+            print(f"DEBUG UART - Received: {bytes(response)}")
         return response
     else:
-        print("DEBUG UART - No response received")
+        if _DEBUG:
+            print("DEBUG UART - No response received")
+        return None
+
+
+# Bytes that may appear inside a float token in scientific notation
+_FLOAT_BYTES = b'0123456789.+-eE'
+
+
+@micropython.native
+def _scan_float(data):
+    """
+    Locates the first float-shaped byte run in a raw response and converts
+    it, without decoding to str or running the regex engine.
+
+    Compiled with the native emitter: the per-byte scan loop runs as
+    machine code instead of dispatched bytecode.
+
+    Args:
+        - data (bytes): Raw response bytes, framing included.
+
+    Returns:
+        - float | None: Converted value, or None if no number is present.
+    """
+    n = len(data)
+    i = 0
+
+    # Skip framing and control bytes (ACK, SI, EOT, separators) until a
+    # byte that can start a number
+    while i < n and not (0x30 <= data[i] <= 0x39 or data[i] in (0x2B, 0x2D, 0x2E)):
+        i += 1
+    start = i
+
+    # Consume the digits / sign / exponent run
+    while i < n and data[i] in _FLOAT_BYTES:
+        i += 1
+
+    if i == start:
+        return None
+    try:
+        return float(bytes(data[start:i]))
+    except ValueError:
         return None
 
 
@@ -206,33 +340,19 @@ def parse_parameter_value(response: bytes):
     if not response or len(response) < 5:
         return None
 
-    try:
-        # Decode bytes to ASCII and immediately strip control characters
-        # commonly used by the controller protocol (ACK, SI, EOT, etc.)
-        raw = response.decode("ascii", "ignore")
-        clean_raw = raw.replace(chr(6), "").replace(chr(15), "").replace(chr(4), "")
+    # Single pass over the raw bytes: the previous implementation decoded
+    # to str, made three .replace copies and invoked MicroPython's
+    # interpreted re engine for every scrape
+    val = _scan_float(response)
 
-        # Use a regular expression to extract a floating-point number
-        match = re.search(r"([-+]?\d+\.\d+[eE][-+]?\d+)", clean_raw)
-
-         # If no valid number is found, the response is considered invalid
-        if not match:
-            return None
-        
-         # Convert the extracted string to a float
-        val = float(match.group(1))
-        
-        # Safety check:
-        # On this type of controller, an exact or negative zero reading is often caused by communication noise
-        # or parsing artifacts, not by a real physical measurement
-        if val <= 0:
-            return None
-            
-        return val
-    
-    except:
+    # Safety check:
+    # On this type of controller, an exact or negative zero reading is often caused by communication noise
+    # or parsing artifacts, not by a real physical measurement
+    if val is None or val <= 0:
         return None
 
+    return val
+
 
 
 def setup_metrics():
@@ -246,15 +366,48 @@ def setup_metrics():
         - None
     """
     global METRICS
+
+    # The tag set is fixed after boot; format the label block once here
+    # instead of per gauge construction.
+    # Example: { "location": "lab", "id": "001" } --> location="lab",id="001"
     tags = GLOBAL_CONFIG["tags"]
+    labels = ','.join(['{k}="{v}"'.format(k=k, v=v) for k, v in tags.items()])
+
     pressure = uGauge(
         name="graphix_pressure_value",
         documentation="Pressure gauge value in Pa",
         unit="Pa",
-        tags=tags
+        labels=labels
     )
     METRICS["pressure"] = pressure
 
+    global _METRICS_LIST
+    _METRICS_LIST = tuple(METRICS.values())
+
+
+
+def _render_metrics():
+    """
+    Renders the full exposition body into the shared output buffer.
+
+    Called once per scrape update rather than per HTTP request, so any
+    number of scrapes arriving between updates are served the exact same
+    cached bytes without re-rendering.
+
+    Returns:
+        - None
+    """
+    del _OUT[:]
+    for metric in _METRICS_LIST:
+        metric.render_into(_OUT)
+
+    status_line = _STATUS_LINES.get(scraper_status)
+    if status_line is None:
+        status_line = ('graphix_scraper_status{status="%s"} 1'
+                       % scraper_status).encode()
+        _STATUS_LINES[scraper_status] = status_line
+    _OUT.extend(status_line)
+    _OUT.extend(b'\n')
 
 
 def serve_prometheus_metrics(s):
@@ -270,41 +423,59 @@ def serve_prometheus_metrics(s):
     global scraper_status
     conn = None
     try:
-        s.settimeout(0.1) 
+        # The caller only invokes this when poll() reported the listen
+        # socket readable, so the non-blocking accept succeeds immediately;
+        # the guard covers the client vanishing in between
         conn, addr = s.accept()
     except OSError:
         return 
 
     try:
-        # Let time for the switch data to arrive.
-        utime.sleep_ms(50) 
-        
-        conn.settimeout(2.0)
-        request = conn.recv(1024)
-
-        # Answering every 'GET' requests to avoid "Empty reply"
-        if request and b'GET' in request:
-            metrics_body = []
-            for name, metric in METRICS.items():
-                metrics_body.append(str(metric))
-
-            metrics_body.append(f"graphix_scraper_status{{status=\"{scraper_status}\"}} 1")
-            body_content = '\n'.join(metrics_body) + '\n'
-
-            # HTTP Header
-            response_headers = (
-                "HTTP/1.1 200 OK\r\n"
-                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
-                "Content-Length: {}\r\n"
-                "Connection: close\r\n"
-                "\r\n"
-            ).format(len(body_content))
-
-            conn.sendall(response_headers.encode('utf-8'))
-            conn.sendall(body_content.encode('utf-8'))
-            
-            # Wait for the W5500 physical delay
-            utime.sleep_ms(200) 
+        # Small single-shot responses suffer most from Nagle batching;
+        # disable it so the metrics payload leaves immediately. Guarded:
+        # not every port's socket module exposes the option.
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError):
+            pass
+
+        # Read until the blank line that ends the request headers instead
+        # of sleeping a flat 50 ms first; a typical scrape request
+        # (~80 bytes) arrives within a few ms of the accept
+        conn.setblocking(False)
+        total = 0
+        deadline = utime.ticks_add(utime.ticks_ms(), 200)
+        while utime.ticks_diff(deadline, utime.ticks_ms()) > 0:
+            try:
+                n = conn.readinto(_RECV_MV[total:])
+            except OSError:
+                n = None
+            if n:
+                total += n
+                # A GET request ends with its header terminator
+                if _RECV_BUF[total - 4:total] == b'\r\n\r\n':
+                    break
+            else:
+                utime.sleep_ms(1)
+        request = _RECV_MV[:total] if total else None
+
+        # Answering every 'GET' requests to avoid "Empty reply"; a prefix
+        # compare on the request line replaces the full substring scan
+        if request and request[:3] == b'GET':
+            # The body was rendered when the last scrape updated the
+            # metrics; the request path is the header format plus one
+            # write of the cached bytes
+            payload = _OUT
+            headers = (b"HTTP/1.1 200 OK\r\n"
+                       b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                       b"Content-Length: %d\r\n"
+                       b"Connection: close\r\n"
+                       b"\r\n" % len(payload))
+
+            # One sendall means one pass through the W5500 SPI stack; the
+            # accurate Content-Length lets the client finish the exchange
+            # cleanly without the old 200 ms settle sleep
+            conn.sendall(headers + payload)
 
         else:
             # If the request is empty, send an error message instead of cutting connexion
@@ -345,16 +516,39 @@ def main_loop(uart):
     s.listen(5) # Increased backlog to handle lab network traffic
     s.setblocking(False)
 
-    # Initialize last scrape time so the first read happens immediately
-    last_scrape_time = utime.time() - interval 
+    # Wait on the listen socket instead of attempting a timed accept every
+    # iteration; poll() returns as soon as a client connects
+    poller = uselect.poll()
+    poller.register(s, uselect.POLLIN)
+
+    # Millisecond tick arithmetic: ticks_ms/ticks_diff are wrap-safe,
+    # ms-accurate and cheaper than utime.time() on the RP2, and they allow
+    # sub-second scrape intervals should the config ever ask for one
+    interval_ms = int(interval * 1000)
+
+    # Seed the cached body so requests arriving before the first scrape
+    # see the metrics in their starting state
+    _render_metrics()
+
+    # Initialize last scrape tick so the first read happens immediately
+    now = utime.ticks_ms()
+    last_scrape_tick = utime.ticks_add(now, -interval_ms)
+    last_gc_tick = now
 
     while True:
-        gc.collect()
-        current_time = utime.time()
+        now = utime.ticks_ms()
+
+        # Defensive collection once every 30 s only; a full gc.collect()
+        # walks the whole heap and costs milliseconds on the RP2, so
+        # running it every iteration dominated the loop budget. Allocation
+        # pressure between sweeps is handled by gc.threshold (set at boot).
+        if utime.ticks_diff(now, last_gc_tick) >= 30000:
+            gc.collect()
+            last_gc_tick = now
 
         # UART polling: performed ONLY when the configured interval has elapsed
-        if current_time - last_scrape_time >= interval:
-            last_scrape_time = current_time
+        if utime.ticks_diff(now, last_scrape_tick) >= interval_ms:
+            last_scrape_tick = now
             try:
                 response = get_graphix_parameter(1, 29, uart) 
                 new_value = parse_parameter_value(response)
@@ -369,11 +563,18 @@ def main_loop(uart):
             except Exception as e:
                 scraper_status = "uart_fail"
 
-        # Serve the HTTP metrics endpoint as frequently as possible
-        serve_prometheus_metrics(s)
+            # Refresh the cached response body for whatever this scrape
+            # changed (value and/or status)
+            _render_metrics()
 
-        # Short sleep to avoid maxing out the CPU
-        utime.sleep_ms(10) 
+        # Sleep exactly until the next scrape deadline unless a client
+        # connects first, capped at 500 ms so the GC schedule stays live;
+        # no fixed wakeups remain in the loop
+        wait_ms = interval_ms - utime.ticks_diff(utime.ticks_ms(), last_scrape_tick)
+        if wait_ms < 0:
+            wait_ms = 0
+        if poller.poll(min(wait_ms, 500)):
+            serve_prometheus_metrics(s)
 
 
 
@@ -397,7 +598,8 @@ def setup_network():
     # SPI Initialization
     spi = SPI(
         NETWORK_CONFIG["spi_id"], # spi_id: 0
-        baudrate=2000000, 
+        baudrate=30_000_000,  # W5500 is rated past 33 MHz; step down to
+                              # 20 MHz if the link proves unstable
         polarity=0, 
         phase=0,
         sck=machine.Pin(18), 
@@ -412,15 +614,20 @@ def setup_network():
 
     log("INFO", "Connecting to Ethernet...")
 
-    # Poll for connection status (timeout after 10 seconds).
+    # Poll for connection status (timeout after 10 seconds); ifconfig()
+    # allocates a 4-tuple of strings, so only fetch it once on success
     for _ in range(10):
         if nic.isconnected():
-            log("INFO", f"Connected! IP: {nic.ifconfig()[0]}")
-            return nic.ifconfig()[0]
+            break
         utime.sleep(1)
-    
-    log("ERROR", "Ethernet failed.")
-    return False
+
+    if not nic.isconnected():
+        log("ERROR", "Ethernet failed.")
+        return False
+
+    ip = nic.ifconfig()[0]
+    log("INFO", f"Connected! IP: {ip}")
+    return ip
 
 
 if __name__ == "__main__":
@@ -432,6 +639,11 @@ if __name__ == "__main__":
     # Initialize Metrics (data structures)
     setup_metrics()
 
+    # Let the runtime collect when allocation volume warrants instead of
+    # sweeping on a fixed cadence in the hot loop
+    if hasattr(gc, "threshold"):
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
     # Initialize UART and RS232 hardware
     uart = machine.UART(
         GRAPHIX_CONFIG["uart_id"], 